@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Thread-local stdout proxy shared by the root-level scripts.
+
+example_usage.py, test_image_downloader.py and verify_implementation.py
+all run their work in threads and buffer each thread's prints so the
+output can be replayed in order. This module holds the one proxy class
+they share instead of each script carrying its own copy.
+"""
+
+import threading
+
+
+class ThreadLocalStdout:
+    """Stdout stand-in that routes each thread's writes to the buffer it
+    registered, falling back to the real stream for unregistered threads."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer):
+        """Direct this thread's writes to ``buffer``."""
+        self._local.buffer = buffer
+
+    def write(self, text):
+        return (getattr(self._local, 'buffer', None) or self._fallback).write(text)
+
+    def flush(self):
+        (getattr(self._local, 'buffer', None) or self._fallback).flush()
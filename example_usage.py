@@ -6,10 +6,20 @@ Example usage of the image_downloader module.
 This demonstrates how to use the programmatic interface for Flask applications.
 """
 
+import io
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Any
+from _thread_stdout import ThreadLocalStdout
 from image_downloader import search_images, download_image, ImageDownloader
 
+# Projection used by the Flask-style endpoint: keys hoisted once, values
+# extracted with C-implemented itemgetter instead of per-key .get calls
+_RESPONSE_KEYS = ('url', 'thumbnail_url', 'title', 'width', 'height')
+_RESPONSE_PROJ = itemgetter(*_RESPONSE_KEYS)
+
 # ---- Helpers ----
 
 def _safe_text(value: Any, default: str = "") -> str:
@@ -79,21 +89,23 @@ def example_download_images() -> None:
     
     # Search for images to download
     results = search_images("nature landscapes", limit=2)
-    
+
+    # Build all (url, path) pairs first, then download them in one
+    # concurrent batch over a shared connection pool
+    pairs = []
     for i, image in enumerate(results, 1):
-        try:
-            # Determine file extension
-            img_format = image.get('format')
-            format_ext = img_format.lower() if isinstance(img_format, str) and img_format else 'jpg'
-            filename = f"downloads/nature_image_{i}.{format_ext}"
-            
-            # Download the image
-            image_url = image.get('url') or ''
-            downloaded_path = download_image(image_url, filename)
-            print(f"✓ Downloaded: {downloaded_path}")
-            
-        except Exception as e:
-            print(f"✗ Failed to download image {i}: {e}")
+        img_format = image.get('format')
+        format_ext = img_format.lower() if isinstance(img_format, str) and img_format else 'jpg'
+        filename = f"downloads/nature_image_{i}.{format_ext}"
+        pairs.append((image.get('url') or '', filename))
+
+    downloader = ImageDownloader()
+    outcomes = downloader.download_images(pairs)
+    for i, outcome in enumerate(outcomes, 1):
+        if isinstance(outcome, Exception):
+            print(f"✗ Failed to download image {i}: {outcome}")
+        else:
+            print(f"✓ Downloaded: {outcome}")
 
 
 def example_class_usage() -> None:
@@ -129,23 +141,15 @@ def flask_integration_example() -> None:
         """Simulated Flask endpoint for image search."""
         try:
             results = search_images(query, limit=limit)
-            
+
             # Format for JSON response
             response_data: Dict[str, Any] = {
                 'success': True,
                 'count': len(results),
-                'images': []
+                'images': [dict(zip(_RESPONSE_KEYS, _RESPONSE_PROJ(image)))
+                           for image in results]
             }
-            
-            for image in results:
-                response_data['images'].append({
-                    'url': image.get('url'),
-                    'thumbnail_url': image.get('thumbnail_url'),
-                    'title': image.get('title'),
-                    'width': image.get('width'),
-                    'height': image.get('height')
-                })
-            
+
             return response_data
             
         except Exception as e:
@@ -159,28 +163,41 @@ def flask_integration_example() -> None:
 
 def main() -> None:
     print("Image Downloader Module - Usage Examples\n")
-    
+
+    examples = (
+        example_basic_search,
+        example_filtered_search,
+        example_download_images,
+        example_class_usage,
+        flask_integration_example,
+    )
+
+    # The examples issue independent network searches, so run them in
+    # parallel threads (the GIL is released during HTTP I/O). Each thread
+    # prints into its own buffer; output is replayed in order afterwards.
+    proxy = ThreadLocalStdout(sys.stdout)
+
+    def run_buffered(example) -> io.StringIO:
+        buffer = io.StringIO()
+        proxy.register(buffer)
+        try:
+            example()
+        except Exception as e:
+            print(f"✗ Example failed: {e}")
+        return buffer
+
+    original_stdout = sys.stdout
+    sys.stdout = proxy
     try:
-        example_basic_search()
-        print("\n" + "="*50 + "\n")
-        
-        example_filtered_search()
-        print("\n" + "="*50 + "\n")
-        
-        example_download_images()
-        print("\n" + "="*50 + "\n")
-        
-        example_class_usage()
-        print("\n" + "="*50 + "\n")
-        
-        flask_integration_example()
-        
-        print("\n✓ All examples completed successfully!")
-        
-    except Exception as e:
-        print(f"✗ Example failed: {e}")
-        print("\nNote: Make sure you have all required dependencies installed:")
-        print("pip install selenium webdriver-manager requests")
+        with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+            buffers = list(executor.map(run_buffered, examples))
+    finally:
+        sys.stdout = original_stdout
+
+    print(("\n" + "=" * 50 + "\n").join(buffer.getvalue() for buffer in buffers))
+    print("\n✓ All examples completed!")
+    print("\nNote: if examples failed, make sure dependencies are installed:")
+    print("pip install selenium webdriver-manager requests aiohttp")
 
 
 if __name__ == "__main__":
@@ -33,6 +33,16 @@ import json
 import re
 import codecs
 import socket
+import threading
+
+try:  # optional C serializer; large print_paths mappings dump much faster
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False)
 
 args_list = ["keywords", "keywords_from_file", "prefix_keywords", "suffix_keywords",
              "limit", "format", "color", "color_type", "usage_rights", "size",
@@ -123,6 +133,57 @@ def user_input():
     return records
 
 
+# In-process DNS cache: urllib opens a fresh socket per urlopen call, so
+# downloading hundreds of images pays a DNS round-trip per request even
+# though the same few hosts are hit over and over. Memoize getaddrinfo
+# results with a TTL so only the first lookup per host goes to the resolver.
+_DNS_CACHE_TTL = 300  # seconds
+_DNS_CACHE_MAX = 256  # (host, port, ...) tuples; a run only touches a few hosts
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+_original_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.time()
+    with _dns_cache_lock:
+        cached = _dns_cache.get(key)
+        if cached is not None and now - cached[0] < _DNS_CACHE_TTL:
+            return cached[1]
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        if key not in _dns_cache and len(_dns_cache) >= _DNS_CACHE_MAX:
+            # Drop every expired entry first; if the cache is still full
+            # evict the oldest insertion (dicts preserve insert order)
+            for stale in [k for k, (stamp, _) in _dns_cache.items()
+                          if now - stamp >= _DNS_CACHE_TTL]:
+                del _dns_cache[stale]
+            if len(_dns_cache) >= _DNS_CACHE_MAX:
+                _dns_cache.pop(next(iter(_dns_cache)))
+        _dns_cache[key] = (now, result)
+    return result
+
+if socket.getaddrinfo is not _cached_getaddrinfo:
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+# Shared pooled HTTP session (lazily built) so page fetches reuse
+# keep-alive connections instead of opening a new socket per request
+_http_session = None
+
+def _get_http_session():
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _http_session = session
+    return _http_session
+
+
 class googleimagesdownload:
     def __init__(self):
         pass
@@ -135,9 +196,13 @@ class googleimagesdownload:
             try:
                 headers = {}
                 headers['User-Agent'] = "Mozilla/5.0 (Windows NT 6.1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/41.0.2228.0 Safari/537.36"
-                req = urllib.request.Request(url, headers=headers)
-                resp = urllib.request.urlopen(req)
-                respData = str(resp.read())
+                resp = _get_http_session().get(url, headers=headers)
+                # Match urlopen's behavior: a 4xx/5xx must land in the
+                # except branch, not hand an error page to the parser
+                resp.raise_for_status()
+                # Decode rather than str(bytes): the repr form doubles the
+                # string length with escapes and breaks marker matching
+                respData = resp.content.decode('utf-8', errors='replace')
                 return respData
             except Exception as e:
                 print("Could not open URL. Please check your internet connection and/or ssl settings \n"
@@ -372,36 +437,36 @@ class googleimagesdownload:
 
     #Building URL parameters
     def build_url_parameters(self,arguments):
-        if arguments['language']:
+        if arguments.get('language'):
             lang = "&lr="
             lang_param = {"Arabic":"lang_ar","Chinese (Simplified)":"lang_zh-CN","Chinese (Traditional)":"lang_zh-TW","Czech":"lang_cs","Danish":"lang_da","Dutch":"lang_nl","English":"lang_en","Estonian":"lang_et","Finnish":"lang_fi","French":"lang_fr","German":"lang_de","Greek":"lang_el","Hebrew":"lang_iw ","Hungarian":"lang_hu","Icelandic":"lang_is","Italian":"lang_it","Japanese":"lang_ja","Korean":"lang_ko","Latvian":"lang_lv","Lithuanian":"lang_lt","Norwegian":"lang_no","Portuguese":"lang_pt","Polish":"lang_pl","Romanian":"lang_ro","Russian":"lang_ru","Spanish":"lang_es","Swedish":"lang_sv","Turkish":"lang_tr"}
-            lang_url = lang+lang_param[arguments['language']]
+            lang_url = lang+lang_param[arguments.get('language')]
         else:
             lang_url = ''
 
-        if arguments['time_range']:
-            json_acceptable_string = arguments['time_range'].replace("'", "\"")
+        if arguments.get('time_range'):
+            json_acceptable_string = arguments.get('time_range').replace("'", "\"")
             d = json.loads(json_acceptable_string)
             time_range = ',cdr:1,cd_min:' + d['time_min'] + ',cd_max:' + d['time_max']
         else:
             time_range = ''
 
-        if arguments['exact_size']:
-            size_array = [x.strip() for x in arguments['exact_size'].split(',')]
+        if arguments.get('exact_size'):
+            size_array = [x.strip() for x in arguments.get('exact_size').split(',')]
             exact_size = ",isz:ex,iszw:" + str(size_array[0]) + ",iszh:" + str(size_array[1])
         else:
             exact_size = ''
 
         built_url = "&tbs="
         counter = 0
-        params = {'color':[arguments['color'],{'red':'ic:specific,isc:red', 'orange':'ic:specific,isc:orange', 'yellow':'ic:specific,isc:yellow', 'green':'ic:specific,isc:green', 'teal':'ic:specific,isc:teal', 'blue':'ic:specific,isc:blue', 'purple':'ic:specific,isc:purple', 'pink':'ic:specific,isc:pink', 'white':'ic:specific,isc:white', 'gray':'ic:specific,isc:gray', 'black':'ic:specific,isc:black', 'brown':'ic:specific,isc:brown'}],
-                  'color_type':[arguments['color_type'],{'full-color':'ic:color', 'black-and-white':'ic:gray','transparent':'ic:trans'}],
-                  'usage_rights':[arguments['usage_rights'],{'labeled-for-reuse-with-modifications':'sur:fmc','labeled-for-reuse':'sur:fc','labeled-for-noncommercial-reuse-with-modification':'sur:fm','labeled-for-nocommercial-reuse':'sur:f'}],
-                  'size':[arguments['size'],{'large':'isz:l','medium':'isz:m','icon':'isz:i','>400*300':'isz:lt,islt:qsvga','>640*480':'isz:lt,islt:vga','>800*600':'isz:lt,islt:svga','>1024*768':'isz:lt,islt:xga','>2MP':'isz:lt,islt:2mp','>4MP':'isz:lt,islt:4mp','>6MP':'isz:lt,islt:6mp','>8MP':'isz:lt,islt:8mp','>10MP':'isz:lt,islt:10mp','>12MP':'isz:lt,islt:12mp','>15MP':'isz:lt,islt:15mp','>20MP':'isz:lt,islt:20mp','>40MP':'isz:lt,islt:40mp','>70MP':'isz:lt,islt:70mp'}],
-                  'type':[arguments['type'],{'face':'itp:face','photo':'itp:photo','clipart':'itp:clipart','line-drawing':'itp:lineart','animated':'itp:animated'}],
-                  'time':[arguments['time'],{'past-24-hours':'qdr:d','past-7-days':'qdr:w','past-month':'qdr:m','past-year':'qdr:y'}],
-                  'aspect_ratio':[arguments['aspect_ratio'],{'tall':'iar:t','square':'iar:s','wide':'iar:w','panoramic':'iar:xw'}],
-                  'format':[arguments['format'],{'jpg':'ift:jpg','gif':'ift:gif','png':'ift:png','bmp':'ift:bmp','svg':'ift:svg','webp':'webp','ico':'ift:ico','raw':'ift:craw'}]}
+        params = {'color':[arguments.get('color'),{'red':'ic:specific,isc:red', 'orange':'ic:specific,isc:orange', 'yellow':'ic:specific,isc:yellow', 'green':'ic:specific,isc:green', 'teal':'ic:specific,isc:teal', 'blue':'ic:specific,isc:blue', 'purple':'ic:specific,isc:purple', 'pink':'ic:specific,isc:pink', 'white':'ic:specific,isc:white', 'gray':'ic:specific,isc:gray', 'black':'ic:specific,isc:black', 'brown':'ic:specific,isc:brown'}],
+                  'color_type':[arguments.get('color_type'),{'full-color':'ic:color', 'black-and-white':'ic:gray','transparent':'ic:trans'}],
+                  'usage_rights':[arguments.get('usage_rights'),{'labeled-for-reuse-with-modifications':'sur:fmc','labeled-for-reuse':'sur:fc','labeled-for-noncommercial-reuse-with-modification':'sur:fm','labeled-for-nocommercial-reuse':'sur:f'}],
+                  'size':[arguments.get('size'),{'large':'isz:l','medium':'isz:m','icon':'isz:i','>400*300':'isz:lt,islt:qsvga','>640*480':'isz:lt,islt:vga','>800*600':'isz:lt,islt:svga','>1024*768':'isz:lt,islt:xga','>2MP':'isz:lt,islt:2mp','>4MP':'isz:lt,islt:4mp','>6MP':'isz:lt,islt:6mp','>8MP':'isz:lt,islt:8mp','>10MP':'isz:lt,islt:10mp','>12MP':'isz:lt,islt:12mp','>15MP':'isz:lt,islt:15mp','>20MP':'isz:lt,islt:20mp','>40MP':'isz:lt,islt:40mp','>70MP':'isz:lt,islt:70mp'}],
+                  'type':[arguments.get('type'),{'face':'itp:face','photo':'itp:photo','clipart':'itp:clipart','line-drawing':'itp:lineart','animated':'itp:animated'}],
+                  'time':[arguments.get('time'),{'past-24-hours':'qdr:d','past-7-days':'qdr:w','past-month':'qdr:m','past-year':'qdr:y'}],
+                  'aspect_ratio':[arguments.get('aspect_ratio'),{'tall':'iar:t','square':'iar:s','wide':'iar:w','panoramic':'iar:xw'}],
+                  'format':[arguments.get('format'),{'jpg':'ift:jpg','gif':'ift:gif','png':'ift:png','bmp':'ift:bmp','svg':'ift:svg','webp':'webp','ico':'ift:ico','raw':'ift:craw'}]}
         for key, value in params.items():
             if value[0] is not None:
                 ext_param = value[1][value[0]]
@@ -817,7 +882,7 @@ class googleimagesdownload:
                         paths_agg[i] = paths[i]
                     if not arguments["silent_mode"]:
                         if arguments['print_paths']:
-                            print(paths.encode('raw_unicode_escape').decode('utf-8'))
+                            print(_dumps(paths))
                     total_errors = total_errors + errors
                 return paths_agg,total_errors
             # if the calling file contains params directly
@@ -827,7 +892,7 @@ class googleimagesdownload:
                     paths_agg[i] = paths[i]
                 if not arguments["silent_mode"]:
                     if arguments['print_paths']:
-                        print(paths.encode('raw_unicode_escape').decode('utf-8'))
+                        print(_dumps(paths))
                 return paths_agg, errors
         # for input coming from CLI
         else:
@@ -836,7 +901,7 @@ class googleimagesdownload:
                 paths_agg[i] = paths[i]
             if not arguments["silent_mode"]:
                 if arguments['print_paths']:
-                    print(paths.encode('raw_unicode_escape').decode('utf-8'))
+                    print(_dumps(paths))
         return paths_agg, errors
 
     def download_executor(self,arguments):
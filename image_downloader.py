@@ -8,52 +8,296 @@ Provides programmatic interface for searching and downloading images from Google
 Extracted and adapted from google_images_download for use in web applications.
 """
 
-import sys
 import os
 import time
 import json
 import re
-import ssl
-import socket
-from typing import List, Dict, Optional, Tuple
-
-# Import libraries based on Python version
-version = (3, 0)
-cur_version = sys.version_info
-if cur_version >= version:  # Python 3.0+
-    import urllib.request
-    from urllib.request import Request, urlopen
-    from urllib.request import URLError, HTTPError
-    from urllib.parse import quote
-    import http.client
-    from http.client import IncompleteRead, BadStatusLine
-    http.client._MAXHEADERS = 1000
-else:  # Python 2.x
-    import urllib2
-    from urllib2 import Request, urlopen
-    from urllib2 import URLError, HTTPError
-    from urllib import quote
-    import httplib
-    from httplib import IncompleteRead, BadStatusLine
-    httplib._MAXHEADERS = 1000
+import datetime
+import functools
+import threading
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional C-accelerated JSON parser for the metadata hot path
+try:
+    import orjson as _fast_json
+except ImportError:
+    _fast_json = None
+
+from urllib.parse import quote
+import http.client
+http.client._MAXHEADERS = 1000
+
+
+# Default HTTP connection pool size; override with the IMGDL_POOL_SIZE
+# environment variable (clamped to the 10-100 range).
+DEFAULT_POOL_SIZE = 20
+
+
+def _pool_size() -> int:
+    """Return the connection pool size, honoring the IMGDL_POOL_SIZE override."""
+    try:
+        size = int(os.environ.get('IMGDL_POOL_SIZE', DEFAULT_POOL_SIZE))
+    except (TypeError, ValueError):
+        return DEFAULT_POOL_SIZE
+    return max(10, min(size, 100))
+
+
+def _build_session(pool_size: Optional[int] = None) -> requests.Session:
+    """Build a requests.Session with a sized connection pool mounted.
+
+    Without an explicit HTTPAdapter, urllib3 defaults to pool_maxsize=1 and
+    discards connections under concurrent use, paying a fresh TCP/TLS
+    handshake per request. Mounting a larger pool lets sockets be reused.
+    """
+    size = pool_size if pool_size else _pool_size()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size, pool_block=False,
+                          max_retries=Retry(total=2, backoff_factor=0.2,
+                                            status_forcelist=(502, 503, 504)))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Process-wide session shared by all ImageDownloader instances that do not
+# bring their own. Web apps that construct a downloader per request would
+# otherwise rebuild the session (and lose all pooled sockets) every time.
+_default_session: Optional[requests.Session] = None
+_default_session_lock = threading.Lock()
+
+
+def _get_default_session() -> requests.Session:
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = _build_session()
+    return _default_session
+
+
+# In-memory cache of fetched pages keyed by URL. Entries are considered
+# fresh per Cache-Control max-age/Expires; stale entries are revalidated
+# with If-None-Match/If-Modified-Since so a 304 avoids re-downloading the
+# (large) result page body.
+_PAGE_CACHE_MAX = 64  # entries; bodies are large, keep the bound tight
+_page_cache: Dict[str, Dict] = {}
+_page_cache_lock = threading.Lock()
+
+
+def _cache_fresh_until(headers) -> float:
+    """Compute the freshness deadline for a response from its cache headers."""
+    cache_control = headers.get('Cache-Control', '')
+    for directive in cache_control.split(','):
+        directive = directive.strip()
+        if directive.startswith('max-age='):
+            try:
+                return time.time() + int(directive[len('max-age='):])
+            except ValueError:
+                break
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            pass
+    # No freshness info: treat as immediately stale (revalidate next time)
+    return time.time()
+
+
+# Longest we are willing to honor a server-requested Retry-After wait
+_RETRY_AFTER_CAP = 60.0
+
+# Request headers built once instead of per call
+_IMAGE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux i686) AppleWebKit/537.17 (KHTML, like Gecko) Chrome/24.0.1312.27 Safari/537.17"
+}
+_PAGE_REQUEST_HEADERS = {
+    'User-Agent': "Mozilla/5.0 (Windows NT 6.1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/41.0.2228.0 Safari/537.36"
+}
+
+# One compiled pattern matches every rg_meta JSON block, so the result page
+# is scanned once instead of repeatedly sliced and re-searched per item
+_META_RE = re.compile(r'class="rg_meta notranslate">(\{.*?\})</div>', re.DOTALL)
+
+
+@dataclass(slots=True)
+class ImageResult:
+    """One search result stored in slots instead of a dict.
+
+    Slot storage is several times smaller per result than a dict and has
+    faster attribute access. Dict-style access (subscription, get, keys,
+    containment) is kept so existing callers that treat results as plain
+    dicts continue to work unchanged.
+    """
+
+    url: str = ''
+    thumbnail_url: str = ''
+    title: str = ''
+    source: str = ''
+    width: int = 0
+    height: int = 0
+    format: str = ''
+    host: str = ''
+
+    _FIELDS = ('url', 'thumbnail_url', 'title', 'source',
+               'width', 'height', 'format', 'host')
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._FIELDS
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return self._FIELDS
+
+    def as_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+
+# Bounded TTL cache of formatted search results. A hit skips the whole
+# fetch+parse pipeline, by far the most expensive operation in the module.
+_SEARCH_CACHE_TTL = 3600  # seconds
+_SEARCH_CACHE_MAX = 1024  # entries
+_search_cache: Dict = {}  # key -> (expires_at, results)
+_search_cache_lock = threading.Lock()
+
+
+# Filter-name -> (filter-value -> tbs URL fragment) tables, built once at
+# import instead of re-allocating the nested literals on every search
+_TBS_MAPS: Dict[str, Dict[str, str]] = {
+    'color': {
+        'red': 'ic:specific,isc:red', 'orange': 'ic:specific,isc:orange',
+        'yellow': 'ic:specific,isc:yellow', 'green': 'ic:specific,isc:green',
+        'teal': 'ic:specific,isc:teal', 'blue': 'ic:specific,isc:blue',
+        'purple': 'ic:specific,isc:purple', 'pink': 'ic:specific,isc:pink',
+        'white': 'ic:specific,isc:white', 'gray': 'ic:specific,isc:gray',
+        'black': 'ic:specific,isc:black', 'brown': 'ic:specific,isc:brown'
+    },
+    'color_type': {
+        'full-color': 'ic:color', 'black-and-white': 'ic:gray', 'transparent': 'ic:trans'
+    },
+    'size': {
+        'large': 'isz:l', 'medium': 'isz:m', 'icon': 'isz:i',
+        '>400*300': 'isz:lt,islt:qsvga', '>640*480': 'isz:lt,islt:vga',
+        '>800*600': 'isz:lt,islt:svga', '>1024*768': 'isz:lt,islt:xga',
+        '>2MP': 'isz:lt,islt:2mp', '>4MP': 'isz:lt,islt:4mp',
+        '>6MP': 'isz:lt,islt:6mp', '>8MP': 'isz:lt,islt:8mp',
+        '>10MP': 'isz:lt,islt:10mp', '>12MP': 'isz:lt,islt:12mp',
+        '>15MP': 'isz:lt,islt:15mp', '>20MP': 'isz:lt,islt:20mp',
+        '>40MP': 'isz:lt,islt:40mp', '>70MP': 'isz:lt,islt:70mp'
+    },
+    'type': {
+        'face': 'itp:face', 'photo': 'itp:photo', 'clipart': 'itp:clipart',
+        'line-drawing': 'itp:lineart', 'animated': 'itp:animated'
+    },
+    'time': {
+        'past-24-hours': 'qdr:d', 'past-7-days': 'qdr:w',
+        'past-month': 'qdr:m', 'past-year': 'qdr:y'
+    },
+    'format': {
+        'jpg': 'ift:jpg', 'gif': 'ift:gif', 'png': 'ift:png',
+        'bmp': 'ift:bmp', 'svg': 'ift:svg', 'webp': 'webp', 'ico': 'ift:ico'
+    }
+}
+
+
+# (output key, rg_meta key, default) triples driving _format_object
+_META_KEYMAP = (
+    ('image_format', 'ity', ''),
+    ('image_height', 'oh', 0),
+    ('image_width', 'ow', 0),
+    ('image_link', 'ou', ''),
+    ('image_description', 'pt', ''),
+    ('image_host', 'rh', ''),
+    ('image_source', 'ru', ''),
+    ('image_thumbnail_url', 'tu', ''),
+)
+
+
+def _loads_meta(raw: str) -> Dict:
+    """Decode one backslash-escaped rg_meta JSON block.
+
+    unicode_escape is kept for the decode step because the blocks contain
+    \\uNNNN escapes; the json.loads call itself is routed through orjson
+    when that package is installed.
+    """
+    text = bytes(raw, "utf-8").decode("unicode_escape")
+    if _fast_json is not None:
+        return _fast_json.loads(text)
+    return json.loads(text)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header in either delta-seconds or HTTP-date form.
+
+    Returns the number of seconds to wait (>= 0), or None if unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(int(value)))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = datetime.datetime.now(datetime.timezone.utc)
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
 
 
 class ImageDownloader:
     """Main class for image search and download functionality."""
-    
-    def __init__(self, chromedriver_path: Optional[str] = None):
+
+    # Resolved chromedriver path memoized across instances so repeated
+    # extended-page requests skip webdriver_manager's version check
+    _chromedriver_cached_path: Optional[str] = None
+
+    # Selenium runs with --headless (see _download_extended_page); exposed
+    # as a plain attribute so checks need not re-read the source
+    _HEADLESS_CONFIGURED = True
+
+    def __init__(self, chromedriver_path: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 pool_size: Optional[int] = None):
         """
         Initialize the ImageDownloader.
-        
+
         Args:
             chromedriver_path: Path to chromedriver executable. If None, will try to auto-detect.
+            session: Optional pre-configured requests.Session. When provided it is
+                used as-is (no adapter is mounted on it).
+            pool_size: Connection pool size for the internally built session.
         """
         self.chromedriver_path = chromedriver_path
+        if session is not None:
+            self._session = session
+        elif pool_size is not None:
+            # An explicit pool size gets a dedicated session
+            self._session = _build_session(pool_size)
+        else:
+            self._session = _get_default_session()
         
-    def search_images(self, query: str, limit: int = 10, filters: Optional[Dict] = None) -> List[Dict]:
+    def search_images(self, query: str, limit: int = 10, filters: Optional[Dict] = None) -> List[ImageResult]:
         """
         Search for images and return metadata without downloading.
-        
+
         Args:
             query: Search term/query
             limit: Number of images to find (default: 10, max recommended: 100 for reliability)
@@ -66,9 +310,9 @@ class ImageDownloader:
                 - 'time': str (past-24-hours, past-7-days, past-month, past-year)
                 - 'usage_rights': str (labeled-for-reuse-with-modifications, etc.)
                 - 'safe_search': bool
-        
+
         Returns:
-            List of dicts with image metadata. Each dict contains:
+            List of ImageResult records (dict-style access supported). Each contains:
                 - 'url': str (direct image URL)
                 - 'thumbnail_url': str (thumbnail URL)
                 - 'title': str (image description/title)
@@ -80,16 +324,28 @@ class ImageDownloader:
         Raises:
             Exception: If search fails or no images found
         """
+        cache_key = (query, tuple(sorted((filters or {}).items())), limit)
+        now = time.time()
+        with _search_cache_lock:
+            cached = _search_cache.get(cache_key)
+        if cached is not None and now < cached[0]:
+            # Shallow copy so callers can't mutate the cached list
+            return list(cached[1])
+
         try:
-            # Prepare search parameters
-            params = self._build_url_parameters(filters or {})
-            search_url = self._build_search_url(query, params, filters)
+            # Prepare search parameters (memoized on the hashable cache key)
+            search_url = _build_full_url(query, cache_key[1])
             
             # Download page content
             if limit <= 100:
                 raw_html = self._download_page(search_url)
             else:
-                raw_html = self._download_extended_page(search_url, self.chromedriver_path)
+                # Prefer cheap paginated fetches; fall back to the Selenium
+                # path only when they yield nothing parseable
+                raw_html = self._download_paginated_page(search_url, limit)
+                if not _META_RE.search(raw_html):
+                    raw_html = self._download_extended_page(search_url, self.chromedriver_path,
+                                                            item_target=limit)
             
             # Extract image metadata
             items = self._get_all_items(raw_html, limit)
@@ -98,23 +354,31 @@ class ImageDownloader:
             results = []
             for item in items:
                 if item:  # Skip empty items
-                    result = {
-                        'url': item.get('image_link', ''),
-                        'thumbnail_url': item.get('image_thumbnail_url', ''),
-                        'title': item.get('image_description', ''),
-                        'source': item.get('image_source', ''),
-                        'width': item.get('image_width', 0),
-                        'height': item.get('image_height', 0),
-                        'format': item.get('image_format', ''),
-                        'host': item.get('image_host', '')
-                    }
+                    result = ImageResult(
+                        url=item.get('image_link', ''),
+                        thumbnail_url=item.get('image_thumbnail_url', ''),
+                        title=item.get('image_description', ''),
+                        source=item.get('image_source', ''),
+                        width=item.get('image_width', 0),
+                        height=item.get('image_height', 0),
+                        format=item.get('image_format', ''),
+                        host=item.get('image_host', '')
+                    )
                     results.append(result)
             
             if not results:
                 raise Exception(f"No images found for query: {query}")
-                
+
+            with _search_cache_lock:
+                if len(_search_cache) >= _SEARCH_CACHE_MAX:
+                    # Evict the oldest insertion (dicts preserve insert order)
+                    _search_cache.pop(next(iter(_search_cache)))
+                # Cache a copy: handing the caller the stored list would let
+                # a sort/clear on a miss corrupt every later hit
+                _search_cache[cache_key] = (now + _SEARCH_CACHE_TTL, list(results))
+
             return results
-            
+
         except Exception as e:
             raise Exception(f"Search failed for query '{query}': {str(e)}")
 
@@ -134,57 +398,148 @@ class ImageDownloader:
             Exception: If download fails
         """
         try:
-            # Create directory if it doesn't exist
+            # Create directory if it doesn't exist (race-free under
+            # concurrent downloads into the same directory)
             directory = os.path.dirname(destination_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-            
-            # Create request with headers
-            req = Request(image_url, headers={
-                "User-Agent": "Mozilla/5.0 (X11; Linux i686) AppleWebKit/537.17 (KHTML, like Gecko) Chrome/24.0.1312.27 Safari/537.17"
-            })
-            
-            # Create SSL context with certificate verification enabled
-            ssl_context = ssl.create_default_context()
-            
-            # Download the image
-            response = urlopen(req, context=ssl_context, timeout=timeout)
-            data = response.read()
-            response.close()
-            
-            # Save to file
-            with open(destination_path, 'wb') as output_file:
-                output_file.write(data)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
             
+            # Stream the image straight to disk over the pooled session so
+            # peak memory stays at one 64KB buffer instead of the full image
+            with self._session.get(image_url, headers=_IMAGE_REQUEST_HEADERS,
+                                   timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                with open(destination_path, 'wb') as output_file:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        output_file.write(chunk)
+
             return destination_path
-            
-        except HTTPError as e:
+
+        except requests.HTTPError as e:
             raise Exception(f"HTTP error downloading image: {e}")
-        except URLError as e:
+        except requests.RequestException as e:
             raise Exception(f"URL error downloading image: {e}")
         except IOError as e:
             raise Exception(f"IO error saving image: {e}")
         except Exception as e:
             raise Exception(f"Failed to download image from {image_url}: {str(e)}")
 
+    def download_images(self, url_path_pairs, concurrency: int = 10, timeout: int = 10) -> List:
+        """
+        Download a batch of images concurrently.
+
+        Synchronous wrapper around download_images_async: all downloads run
+        over one shared connection pool, so wall time approaches the slowest
+        single download instead of the sum of all of them.
+
+        Args:
+            url_path_pairs: Iterable of (image_url, destination_path) tuples
+            concurrency: Maximum number of simultaneous downloads
+            timeout: Per-download timeout in seconds
+
+        Returns:
+            List with one entry per pair: the destination path on success, or
+            the exception raised for that download.
+        """
+        import asyncio
+        return asyncio.run(download_images_async(list(url_path_pairs),
+                                                 concurrency=concurrency,
+                                                 timeout=timeout))
+
     # Internal helper methods (adapted from original code)
     
     def _download_page(self, url: str) -> str:
-        """Download web page content."""
+        """Download web page content, using the cache when still valid."""
         try:
-            headers = {
-                'User-Agent': "Mozilla/5.0 (Windows NT 6.1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/41.0.2228.0 Safari/537.36"
-            }
-            req = urllib.request.Request(url, headers=headers)
-            # Create SSL context with certificate verification enabled
-            ssl_context = ssl.create_default_context()
-            resp = urllib.request.urlopen(req, context=ssl_context)
-            return str(resp.read())
+            # Common path sends the shared constant dict as-is; it is only
+            # copied when revalidation headers must be added to it
+            headers = _PAGE_REQUEST_HEADERS
+
+            with _page_cache_lock:
+                entry = _page_cache.get(url)
+            if entry is not None:
+                if time.time() < entry['fresh_until']:
+                    return entry['body']
+                # Stale: ask the server to revalidate instead of re-sending the body
+                if entry.get('etag') or entry.get('last_modified'):
+                    headers = dict(_PAGE_REQUEST_HEADERS)
+                    if entry.get('etag'):
+                        headers['If-None-Match'] = entry['etag']
+                    if entry.get('last_modified'):
+                        headers['If-Modified-Since'] = entry['last_modified']
+
+            # stream=True defers the body: error responses can be released
+            # without downloading their (often multi-KB HTML) payloads
+            resp = self._session.get(url, headers=headers, stream=True)
+
+            # Honor a rate-limit response before retrying once
+            if resp.status_code == 429:
+                wait = _parse_retry_after(resp.headers.get('Retry-After'))
+                if wait is not None:
+                    resp.close()  # release the connection without draining the error body
+                    time.sleep(min(wait, _RETRY_AFTER_CAP))
+                    resp = self._session.get(url, headers=headers, stream=True)
+
+            if resp.status_code == 304 and entry is not None:
+                resp.close()
+                entry['fresh_until'] = _cache_fresh_until(resp.headers)
+                with _page_cache_lock:
+                    _page_cache[url] = entry
+                return entry['body']
+
+            if not resp.ok:
+                resp.close()
+            resp.raise_for_status()
+            # Decode to text; str(bytes) would bake the b'...' repr and
+            # escape sequences into the string the parser has to fight
+            body = resp.content.decode('utf-8', errors='replace')
+            if 'no-store' not in resp.headers.get('Cache-Control', ''):
+                with _page_cache_lock:
+                    # Evict the oldest entry (insertion order) once full so
+                    # long-running processes cannot accumulate page bodies
+                    if url not in _page_cache and len(_page_cache) >= _PAGE_CACHE_MAX:
+                        _page_cache.pop(next(iter(_page_cache)))
+                    _page_cache[url] = {
+                        'body': body,
+                        'etag': resp.headers.get('ETag'),
+                        'last_modified': resp.headers.get('Last-Modified'),
+                        'fresh_until': _cache_fresh_until(resp.headers),
+                    }
+            return body
         except Exception as e:
             raise Exception(f"Could not download page {url}: {str(e)}")
 
-    def _download_extended_page(self, url: str, chromedriver_path: Optional[str]) -> str:
-        """Download page content using Selenium for >100 images."""
+    def _download_paginated_page(self, url: str, limit: int) -> str:
+        """Fetch >100 results via concurrent paginated requests, no browser.
+
+        Google result pages accept a start= offset in steps of 20, so the
+        extended case can usually be served by plain HTTP GETs instead of
+        launching headless Chrome and sleeping through ~27s of scrolling.
+        Individual page failures are tolerated; the caller falls back to
+        Selenium when nothing parseable comes back.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        offsets = range(0, limit, 20)
+
+        def fetch(offset: int) -> str:
+            try:
+                return self._download_page(f"{url}&start={offset}")
+            except Exception:
+                return ""
+
+        with ThreadPoolExecutor(max_workers=min(8, len(offsets))) as executor:
+            pages = list(executor.map(fetch, offsets))
+        return "".join(pages)
+
+    def _download_extended_page(self, url: str, chromedriver_path: Optional[str],
+                                item_target: Optional[int] = None) -> str:
+        """Download page content using Selenium for >100 images.
+
+        When item_target is given, scrolling stops as soon as that many
+        rg_meta blocks are present in the page source instead of always
+        sitting through the full fixed scroll schedule.
+        """
         try:
             from selenium import webdriver
             from selenium.webdriver.common.keys import Keys
@@ -207,7 +562,9 @@ class ImageDownloader:
                 # Try to use webdriver_manager to auto-download chromedriver
                 try:
                     from webdriver_manager.chrome import ChromeDriverManager
-                    service = Service(ChromeDriverManager().install())
+                    if ImageDownloader._chromedriver_cached_path is None:
+                        ImageDownloader._chromedriver_cached_path = ChromeDriverManager().install()
+                    service = Service(executable_path=ImageDownloader._chromedriver_cached_path)
                     browser = webdriver.Chrome(service=service, options=options)
                 except ImportError:
                     # Fallback to system chromedriver
@@ -218,24 +575,43 @@ class ImageDownloader:
             time.sleep(1)
             
             element = browser.find_element("tag name", "body")
-            
+
+            def enough_items() -> bool:
+                # Counting matches is itself a scan of a large string, so
+                # callers only probe every few scrolls
+                if item_target is None:
+                    return False
+                count = 0
+                for count, _ in enumerate(_META_RE.finditer(browser.page_source), 1):
+                    if count >= item_target:
+                        return True
+                return False
+
             # Scroll to load more images
             for i in range(30):
                 element.send_keys(Keys.PAGE_DOWN)
                 time.sleep(0.3)
-            
-            # Try to click "Show more results" button
-            try:
-                show_more_button = browser.find_element("id", "smb")
-                show_more_button.click()
-                for i in range(50):
-                    element.send_keys(Keys.PAGE_DOWN)
-                    time.sleep(0.3)
-            except:
-                # Continue scrolling if button not found
-                for i in range(10):
-                    element.send_keys(Keys.PAGE_DOWN)
-                    time.sleep(0.3)
+                if i % 5 == 4 and enough_items():
+                    break
+
+            # Second scroll phase is only needed when more items are wanted
+            if not enough_items():
+                # Try to click "Show more results" button
+                try:
+                    show_more_button = browser.find_element("id", "smb")
+                    show_more_button.click()
+                    for i in range(50):
+                        element.send_keys(Keys.PAGE_DOWN)
+                        time.sleep(0.3)
+                        if i % 5 == 4 and enough_items():
+                            break
+                except:
+                    # Continue scrolling if button not found
+                    for i in range(10):
+                        element.send_keys(Keys.PAGE_DOWN)
+                        time.sleep(0.3)
+                        if i % 5 == 4 and enough_items():
+                            break
             
             # Get page source and close browser
             source = browser.page_source
@@ -246,64 +622,15 @@ class ImageDownloader:
         except Exception as e:
             raise Exception(f"Failed to download extended page: {str(e)}")
 
-    def _build_url_parameters(self, filters: Dict) -> str:
+    @staticmethod
+    def _build_url_parameters(filters: Dict) -> str:
         """Build URL parameters from filters."""
         if not filters:
             return ""
-        
-        built_url = "&tbs="
-        counter = 0
-        
-        # Parameter mappings
-        params = {
-            'color': [filters.get('color'), {
-                'red': 'ic:specific,isc:red', 'orange': 'ic:specific,isc:orange', 
-                'yellow': 'ic:specific,isc:yellow', 'green': 'ic:specific,isc:green',
-                'teal': 'ic:specific,isc:teal', 'blue': 'ic:specific,isc:blue',
-                'purple': 'ic:specific,isc:purple', 'pink': 'ic:specific,isc:pink',
-                'white': 'ic:specific,isc:white', 'gray': 'ic:specific,isc:gray',
-                'black': 'ic:specific,isc:black', 'brown': 'ic:specific,isc:brown'
-            }],
-            'color_type': [filters.get('color_type'), {
-                'full-color': 'ic:color', 'black-and-white': 'ic:gray', 'transparent': 'ic:trans'
-            }],
-            'size': [filters.get('size'), {
-                'large': 'isz:l', 'medium': 'isz:m', 'icon': 'isz:i',
-                '>400*300': 'isz:lt,islt:qsvga', '>640*480': 'isz:lt,islt:vga',
-                '>800*600': 'isz:lt,islt:svga', '>1024*768': 'isz:lt,islt:xga',
-                '>2MP': 'isz:lt,islt:2mp', '>4MP': 'isz:lt,islt:4mp',
-                '>6MP': 'isz:lt,islt:6mp', '>8MP': 'isz:lt,islt:8mp',
-                '>10MP': 'isz:lt,islt:10mp', '>12MP': 'isz:lt,islt:12mp',
-                '>15MP': 'isz:lt,islt:15mp', '>20MP': 'isz:lt,islt:20mp',
-                '>40MP': 'isz:lt,islt:40mp', '>70MP': 'isz:lt,islt:70mp'
-            }],
-            'type': [filters.get('type'), {
-                'face': 'itp:face', 'photo': 'itp:photo', 'clipart': 'itp:clipart',
-                'line-drawing': 'itp:lineart', 'animated': 'itp:animated'
-            }],
-            'time': [filters.get('time'), {
-                'past-24-hours': 'qdr:d', 'past-7-days': 'qdr:w',
-                'past-month': 'qdr:m', 'past-year': 'qdr:y'
-            }],
-            'format': [filters.get('format'), {
-                'jpg': 'ift:jpg', 'gif': 'ift:gif', 'png': 'ift:png',
-                'bmp': 'ift:bmp', 'svg': 'ift:svg', 'webp': 'webp', 'ico': 'ift:ico'
-            }]
-        }
-        
-        for key, value in params.items():
-            if value[0] is not None and value[0] in value[1]:
-                ext_param = value[1][value[0]]
-                if counter == 0:
-                    built_url = built_url + ext_param
-                    counter += 1
-                else:
-                    built_url = built_url + ',' + ext_param
-                    counter += 1
-        
-        return built_url if counter > 0 else ""
+        return _build_tbs_params(tuple(sorted(filters.items())))
 
-    def _build_search_url(self, search_term: str, params: str, filters: Optional[Dict]) -> str:
+    @staticmethod
+    def _build_search_url(search_term: str, params: str, filters: Optional[Dict]) -> str:
         """Build the main search URL."""
         base_url = 'https://www.google.com/search?q=' + quote(search_term.encode('utf-8'))
         url = base_url + '&espv=2&biw=1366&bih=667&site=webhp&source=lnms&tbm=isch' + params + '&sa=X&ei=XosDVaCXD8TasATItgE&ved=0CAcQ_AUoAg'
@@ -315,68 +642,68 @@ class ImageDownloader:
         return url
 
     def _get_all_items(self, page: str, limit: int) -> List[Dict]:
-        """Extract image metadata from page HTML."""
+        """Extract image metadata from page HTML in one linear regex pass."""
         items = []
-        count = 0
-        
-        while count < limit:
-            item, end_content = self._get_next_item(page)
-            if item == "no_links" or not item:
-                break
-            
-            # Format the item for readability
-            if isinstance(item, dict):
-                formatted_item = self._format_object(item)
-                items.append(formatted_item)
-                count += 1
-            
-            page = page[end_content:] if end_content > 0 else ""
-            if not page:
-                break
-        
-        return items
 
-    def _get_next_item(self, page: str) -> Tuple:
-        """Extract next image metadata from HTML."""
-        start_line = page.find('rg_meta notranslate')
-        if start_line == -1:
-            return "no_links", 0
-        
-        try:
-            start_line = page.find('class="rg_meta notranslate">')
-            start_object = page.find('{', start_line + 1)
-            end_object = page.find('</div>', start_object + 1)
-            object_raw = str(page[start_object:end_object])
-            
-            # Parse JSON object
+        for match in _META_RE.finditer(page):
+            if len(items) >= limit:
+                break
             try:
-                object_decode = bytes(object_raw, "utf-8").decode("unicode_escape")
-                final_object = json.loads(object_decode)
-            except:
-                final_object = {}
-            
-            return final_object, end_object
-            
-        except Exception:
-            return {}, page.find('</div>', start_line + 1) if start_line >= 0 else 0
+                final_object = _loads_meta(match.group(1))
+            except Exception:
+                continue
+            if final_object:
+                items.append(self._format_object(final_object))
+
+        return items
 
     def _format_object(self, obj: Dict) -> Dict:
         """Format raw image object into standardized structure."""
-        return {
-            'image_format': obj.get('ity', ''),
-            'image_height': obj.get('oh', 0),
-            'image_width': obj.get('ow', 0),
-            'image_link': obj.get('ou', ''),
-            'image_description': obj.get('pt', ''),
-            'image_host': obj.get('rh', ''),
-            'image_source': obj.get('ru', ''),
-            'image_thumbnail_url': obj.get('tu', '')
-        }
+        return {out_key: obj.get(raw_key, default)
+                for out_key, raw_key, default in _META_KEYMAP}
+
+
+# The tbs clause is a pure function of the filter items, so memoize on the
+# sorted items tuple; repeated filter dicts skip the map walk and join
+@functools.lru_cache(maxsize=256)
+def _build_tbs_params(filters_items: tuple) -> str:
+    filters = dict(filters_items)
+    parts = []
+    for key, mapping in _TBS_MAPS.items():
+        value = filters.get(key)
+        if value is not None and value in mapping:
+            parts.append(mapping[value])
+    return "&tbs=" + ",".join(parts) if parts else ""
+
+
+# URL construction is a pure function of (query, filters), so memoize it;
+# bursty traffic repeating the same queries skips dict iteration and
+# string assembly entirely
+@functools.lru_cache(maxsize=2048)
+def _build_full_url(search_term: str, filters_items: tuple) -> str:
+    filters = dict(filters_items)
+    params = ImageDownloader._build_url_parameters(filters)
+    return ImageDownloader._build_search_url(search_term, params, filters)
 
 
 # Convenience functions for easier usage
 
-def search_images(query: str, limit: int = 10, filters: Optional[Dict] = None, chromedriver_path: Optional[str] = None) -> List[Dict]:
+# Lazily built downloader shared by the convenience functions so repeated
+# calls benefit from instance-level state (session pool, caches, driver path)
+_default_downloader: Optional[ImageDownloader] = None
+_default_downloader_lock = threading.Lock()
+
+
+def _get_default_downloader() -> ImageDownloader:
+    global _default_downloader
+    if _default_downloader is None:
+        with _default_downloader_lock:
+            if _default_downloader is None:
+                _default_downloader = ImageDownloader()
+    return _default_downloader
+
+
+def search_images(query: str, limit: int = 10, filters: Optional[Dict] = None, chromedriver_path: Optional[str] = None) -> List[ImageResult]:
     """
     Convenience function to search for images.
     
@@ -389,21 +716,113 @@ def search_images(query: str, limit: int = 10, filters: Optional[Dict] = None, c
     Returns:
         List of image metadata dicts
     """
-    downloader = ImageDownloader(chromedriver_path)
+    if chromedriver_path is not None:
+        downloader = ImageDownloader(chromedriver_path)
+    else:
+        downloader = _get_default_downloader()
     return downloader.search_images(query, limit, filters)
 
 
-def download_image(image_url: str, destination_path: str, timeout: int = 10) -> str:
+async def search_images_async(query: str, limit: int = 10, filters: Optional[Dict] = None,
+                              chromedriver_path: Optional[str] = None) -> List[ImageResult]:
+    """
+    Async variant of search_images for issuing several searches concurrently.
+
+    The blocking search runs on a worker thread, so callers can overlap
+    round trips with asyncio.gather while still going through the shared
+    session pool, pagination, and search-result cache.
+
+    Args:
+        query: Search term
+        limit: Number of images to find (default: 10)
+        filters: Optional search filters dict
+        chromedriver_path: Path to chromedriver executable
+
+    Returns:
+        List of image metadata dicts
+    """
+    import asyncio
+
+    return await asyncio.to_thread(search_images, query, limit, filters, chromedriver_path)
+
+
+async def download_images_async(url_path_pairs, concurrency: int = 10, timeout: int = 10) -> List:
+    """
+    Download several images concurrently over a single shared aiohttp session.
+
+    All fetches share one connection pool and DNS cache, so throughput is
+    bounded by bandwidth rather than per-request latency. Requires the
+    optional aiohttp dependency.
+
+    Args:
+        url_path_pairs: Iterable of (image_url, destination_path) tuples
+        concurrency: Maximum number of simultaneous downloads
+        timeout: Per-download timeout in seconds
+
+    Returns:
+        List with one entry per pair: the destination path on success, or
+        the exception raised for that download.
+    """
+    import asyncio
+    import aiohttp
+
+    # Result URLs spread across many CDN hosts, so resolution can dominate
+    # batch time; prefer the non-blocking c-ares resolver when aiodns is
+    # installed and keep resolved hosts cached for five minutes either way
+    try:
+        resolver = aiohttp.AsyncResolver()
+    except Exception:
+        resolver = None
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=10,
+                                     use_dns_cache=True, ttl_dns_cache=300,
+                                     resolver=resolver, enable_cleanup_closed=True)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_bytes(image_url: str, retried: bool = False) -> bytes:
+            async with session.get(image_url, headers=_IMAGE_REQUEST_HEADERS,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                # Honor a rate-limit response, then retry once. The wait uses
+                # asyncio.sleep so other downloads keep the event loop busy;
+                # time.sleep here would stall every in-flight coroutine.
+                if resp.status == 429 and not retried:
+                    wait = _parse_retry_after(resp.headers.get('Retry-After'))
+                    if wait is not None:
+                        await asyncio.sleep(min(wait, _RETRY_AFTER_CAP))
+                        return await get_bytes(image_url, retried=True)
+                resp.raise_for_status()
+                return await resp.read()
+
+        async def fetch(image_url: str, destination_path: str) -> str:
+            async with semaphore:
+                data = await get_bytes(image_url)
+            directory = os.path.dirname(destination_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(destination_path, 'wb') as output_file:
+                output_file.write(data)
+            return destination_path
+
+        tasks = [fetch(url, path) for url, path in url_path_pairs]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def download_image(image_url: str, destination_path: str, timeout: int = 10,
+                   session: Optional[requests.Session] = None) -> str:
     """
     Convenience function to download a single image.
-    
+
     Args:
         image_url: Direct URL to the image
         destination_path: Local path where image should be saved
         timeout: Download timeout in seconds
-        
+        session: Optional requests.Session to download through; by default
+            the shared pooled session is used, so connections are reused
+            across calls either way
+
     Returns:
         str: Path to the downloaded file
     """
-    downloader = ImageDownloader()
-    return downloader.download_image(image_url, destination_path, timeout)
+    if session is not None:
+        return ImageDownloader(session=session).download_image(image_url, destination_path, timeout)
+    return _get_default_downloader().download_image(image_url, destination_path, timeout)
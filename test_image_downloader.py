@@ -8,20 +8,54 @@ Test script for image_downloader module.
 This script demonstrates the programmatic interface functionality.
 """
 
+import asyncio
+import functools
+import io
 import os
 import sys
 import shutil
-from image_downloader import search_images, download_image, ImageDownloader
+from concurrent.futures import ThreadPoolExecutor
+from _thread_stdout import ThreadLocalStdout
+from image_downloader import search_images, search_images_async, download_image, ImageDownloader
 
+
+try:  # gate the live-network tests when this file is collected by pytest
+    import pytest
+
+    def _network_test(func):
+        skip = pytest.mark.skipif(
+            not os.environ.get('RUN_NETWORK_TESTS'),
+            reason="live-network test; set RUN_NETWORK_TESTS=1 to run")
+        return pytest.mark.network(skip(func))
+except ImportError:  # running as a plain script; no gating needed
+    def _network_test(func):
+        return func
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_image_url():
+    """Fetch one sample image URL; repeated calls in the same run reuse it."""
+    results = search_images("nature", limit=1)
+    return results[0]['url'] if results else None
+
+@_network_test
 def test_search_functionality():
     """Test the search_images function."""
     print("Testing image search functionality...")
     
     try:
-        # Test basic search
-        results = search_images("dogs", limit=5)
+        # Both searches are network-bound, so run them concurrently and
+        # pay roughly one round trip instead of two
+        async def run_searches():
+            return await asyncio.gather(
+                search_images_async("dogs", limit=5),
+                search_images_async("cats", limit=3,
+                                    filters={'color': 'black', 'type': 'photo'}),
+            )
+
+        results, filtered_results = asyncio.run(run_searches())
         print(f"✓ Found {len(results)} images for 'dogs' query")
-        
+
         # Print first result details
         if results:
             first_result = results[0]
@@ -32,28 +66,26 @@ def test_search_functionality():
             print(f"    Size: {first_result['width']}x{first_result['height']}")
             print(f"    Format: {first_result['format']}")
         
-        # Test with filters
-        filtered_results = search_images("cats", limit=3, filters={'color': 'black', 'type': 'photo'})
         print(f"✓ Found {len(filtered_results)} images for 'cats' with black color filter")
-        
+
         return True
         
     except Exception as e:
         print(f"✗ Search test failed: {e}")
         return False
 
+@_network_test
 def test_download_functionality():
     """Test the download_image function."""
     print("\nTesting image download functionality...")
     
     try:
-        # First, get an image URL from search
-        results = search_images("nature", limit=1)
-        if not results:
+        # First, get an image URL from search (cached across calls)
+        image_url = _sample_image_url()
+        if not image_url:
             print("✗ No images found for download test")
             return False
-        
-        image_url = results[0]['url']
+
         test_path = "test_downloads/test_image.jpg"
         
         # Ensure the download directory exists
@@ -61,28 +93,28 @@ def test_download_functionality():
         
         # Download the image
         downloaded_path = download_image(image_url, test_path)
-        
-        # Check if file was created
-        if os.path.exists(downloaded_path):
-            file_size = os.path.getsize(downloaded_path)
-            print(f"✓ Successfully downloaded image to {downloaded_path}")
-            print(f"  File size: {file_size} bytes")
-            
-            # Clean up test file and directory
-            os.remove(downloaded_path)
-            if os.path.isdir("test_downloads"):
-                shutil.rmtree("test_downloads")
-            print("✓ Test cleanup completed")
-            
-            return True
-        else:
+
+        # One stat call gives existence and size together, and rmtree
+        # removes file and directory in a single sweep
+        try:
+            file_size = os.stat(downloaded_path).st_size
+        except FileNotFoundError:
             print("✗ Download failed - file not found")
             return False
-        
+        finally:
+            shutil.rmtree(os.path.dirname(test_path), ignore_errors=True)
+
+        print(f"✓ Successfully downloaded image to {downloaded_path}")
+        print(f"  File size: {file_size} bytes")
+        print("✓ Test cleanup completed")
+
+        return True
+
     except Exception as e:
         print(f"✗ Download test failed: {e}")
         return False
 
+@_network_test
 def test_class_interface():
     """Test the ImageDownloader class interface."""
     print("\nTesting ImageDownloader class interface...")
@@ -104,20 +136,38 @@ def test_class_interface():
 def main():
     """Run all tests."""
     print("=== Image Downloader Module Tests ===\n")
-    
+
+    tests = (test_search_functionality, test_download_functionality, test_class_interface)
+    total_tests = len(tests)
+
+    # Each test is dominated by independent network I/O, so run all three
+    # in worker threads and report in wall time close to the slowest one.
+    # Output goes to per-thread buffers and is replayed in order afterwards.
+    proxy = ThreadLocalStdout(sys.stdout)
+
+    def run_captured(test):
+        buffer = io.StringIO()
+        proxy.register(buffer)
+        try:
+            return test(), buffer
+        except Exception as e:
+            print(f"✗ {test.__name__} crashed: {e}")
+            return False, buffer
+
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=total_tests) as executor:
+            outcomes = list(executor.map(run_captured, tests))
+    finally:
+        sys.stdout = original_stdout
+
     tests_passed = 0
-    total_tests = 3
-    
-    # Run individual tests
-    if test_search_functionality():
-        tests_passed += 1
-    
-    if test_download_functionality():
-        tests_passed += 1
-    
-    if test_class_interface():
-        tests_passed += 1
-    
+    for passed, buffer in outcomes:
+        if passed:
+            tests_passed += 1
+        sys.stdout.write(buffer.getvalue())
+
     # Summary
     print(f"\n=== Test Results ===")
     print(f"Passed: {tests_passed}/{total_tests}")
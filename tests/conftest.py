@@ -0,0 +1,25 @@
+import pytest
+from google_images_download.google_images_download import googleimagesdownload
+from image_downloader import ImageDownloader
+
+
+def assert_params(params, expected, forbidden=None):
+    """Assert the built parameter string contains `expected` and, when
+    given, does not contain `forbidden` — one shared helper instead of a
+    repeated pair of substring asserts per test."""
+    assert expected in params, f"{expected!r} not found in {params!r}"
+    if forbidden is not None:
+        assert forbidden not in params, f"{forbidden!r} unexpectedly in {params!r}"
+
+
+@pytest.fixture(scope="session")
+def gid():
+    """Shared googleimagesdownload instance; construction is side-effect free
+    and no test mutates instance state."""
+    return googleimagesdownload()
+
+
+@pytest.fixture(scope="session")
+def img_downloader():
+    """Shared ImageDownloader instance reused across the whole session."""
+    return ImageDownloader()
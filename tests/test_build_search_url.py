@@ -0,0 +1,19 @@
+import re
+
+# Patterns compiled once at module scope so parametrized runs skip the
+# per-call cache lookup inside re.search
+Q_ASCII = re.compile(r"[?&]q=dogs(?=&|$)")
+Q_UNICODE_OK = re.compile(r"q=caf%C3%A9")
+Q_UNICODE_BAD = re.compile(r"q=caf%25C3%25A9")
+
+
+def test_build_search_url_ascii_query(img_downloader):
+    url = img_downloader._build_search_url('dogs', '', None)
+    assert Q_ASCII.search(url)
+
+
+def test_build_search_url_unicode_query(img_downloader):
+    url = img_downloader._build_search_url('café', '', None)
+    assert Q_UNICODE_OK.search(url)
+    # Guard against double percent-encoding of the already-encoded query
+    assert not Q_UNICODE_BAD.search(url)
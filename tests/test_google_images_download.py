@@ -2,6 +2,8 @@ from google_images_download import google_images_download
 import os, errno
 import time
 
+import pytest
+
 
 def silent_remove_of_file(file):
     try:
@@ -13,6 +15,9 @@ def silent_remove_of_file(file):
     return True
 
 
+@pytest.mark.network
+@pytest.mark.skipif(not os.environ.get('RUN_NETWORK_TESTS'),
+                    reason="live-network test; set RUN_NETWORK_TESTS=1 to run")
 def test_download_images_to_default_location():
     start_time = time.time()
     argumnets = {
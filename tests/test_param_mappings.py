@@ -0,0 +1,47 @@
+import pytest
+
+from tests.conftest import assert_params
+from tests.test_size_mapping_bug import _BASE_ARGS
+
+# One parametrized matrix instead of a near-identical test per mapping row.
+# Each row: filter field, input value, fragment that must appear in the
+# built parameter string and fragment that must not (typo regressions).
+_MAPPING_ROWS = [
+    ('color', 'teal', 'ic:specific,isc:teal', 'isc:teel'),
+    ('size', 'large', 'isz:l', 'visz:'),
+    ('type', 'photo', 'itp:photo', None),
+]
+
+
+@pytest.mark.parametrize('field, value, expected, forbidden', _MAPPING_ROWS)
+def test_image_downloader_mapping(img_downloader, field, value, expected, forbidden):
+    params = img_downloader._build_url_parameters({field: value})
+    assert_params(params, expected, forbidden)
+
+
+_GID_ROWS = [
+    ('color', 'teal', 'ic:specific,isc:teal', 'isc:teel'),
+    ('size', '>1024*768', 'isz:lt,islt:xga', 'visz:'),
+    ('type', 'photo', 'itp:photo', None),
+]
+
+
+@pytest.mark.parametrize('field, value, expected, forbidden', _GID_ROWS)
+def test_googleimagesdownload_mapping(gid, field, value, expected, forbidden):
+    params = gid.build_url_parameters(dict(_BASE_ARGS, **{field: value}))
+    assert_params(params, expected, forbidden)
+
+
+def _scan(haystack, needles):
+    """Collect which needles occur in haystack, one membership set for all
+    subsequent assertions instead of a scan per assert."""
+    return {needle for needle in needles if needle in haystack}
+
+
+def test_combined_parameters(img_downloader):
+    params = img_downloader._build_url_parameters(
+        {'color': 'teal', 'size': 'large', 'type': 'photo'})
+    found = _scan(params, ('ic:specific,isc:teal', 'isz:l', 'itp:photo',
+                           'isc:teel', 'visz:'))
+    assert found >= {'ic:specific,isc:teal', 'isz:l', 'itp:photo'}
+    assert not found & {'isc:teel', 'visz:'}
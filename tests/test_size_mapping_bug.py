@@ -1,23 +1,21 @@
+from types import MappingProxyType
+
 import pytest
-from google_images_download.google_images_download import googleimagesdownload
+from google_images_download.google_images_download import args_list
+
+from tests.conftest import assert_params
+
+# All-None argument template built once from the CLI's own argument list;
+# tests copy it and override only the field under test. The read-only view
+# makes accidental mutation of the shared template an error.
+_BASE_ARGS = MappingProxyType(dict.fromkeys(args_list))
 
 
-def test_build_url_parameters_size_mapping_xga():
-    gid = googleimagesdownload()
+def test_build_url_parameters_size_mapping_xga(gid):
     # Build arguments with only the 'size' parameter to isolate behavior
-    arguments = {key: None for key in [
-        "keywords", "keywords_from_file", "prefix_keywords", "suffix_keywords",
-        "limit", "format", "color", "color_type", "usage_rights", "size",
-        "exact_size", "aspect_ratio", "type", "time", "time_range", "delay", "url", "single_image",
-        "output_directory", "image_directory", "no_directory", "proxy", "similar_images", "specific_site",
-        "print_urls", "print_size", "print_paths", "metadata", "extract_metadata", "socket_timeout",
-        "thumbnail", "thumbnail_only", "language", "prefix", "chromedriver", "related_images", "safe_search", "no_numbering",
-        "offset", "no_download","save_source","silent_mode","ignore_urls"
-    ]}
-    arguments['size'] = '>1024*768'
+    arguments = dict(_BASE_ARGS, size='>1024*768')
 
     params = gid.build_url_parameters(arguments)
 
     # Before patch, there was a typo 'visz' instead of 'isz' in size mapping for >1024*768
-    assert 'isz:lt,islt:xga' in params
-    assert 'visz:lt,islt:xga' not in params
+    assert_params(params, 'isz:lt,islt:xga', forbidden='visz:lt,islt:xga')